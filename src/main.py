@@ -1,19 +1,52 @@
+import asyncio
+import functools
 import json
 import logging
+import multiprocessing
 import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import PyPDF2
+import pymupdf
+import tiktoken
 import yaml
 from dotenv import load_dotenv
 from langchain.prompts import PromptTemplate
-from langchain_community.callbacks.manager import get_openai_callback
 from langchain_core.runnables import RunnableSequence
 from langchain_xai import ChatXAI
 
 from prompts import get_summary_prompt
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SUFFIX = "_summary.json"
+INDEX_FILENAME = "processed.sqlite"
+
+# Larger PDFs are split into page ranges extracted by separate workers
+PAGES_PER_TASK = 20
+
+# Matches ${VAR} placeholders anywhere in a configuration string
+_ENV_VAR_PATTERN = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@functools.lru_cache(maxsize=1)
+def get_encoding() -> tiktoken.Encoding:
+    """Return the tokenizer used to estimate input sizes."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
 # =========================
 # Configuration and Logging Setup
 # =========================
@@ -38,42 +71,70 @@ class Config:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
         with open(self.config_path, "r", encoding="utf-8") as file:
-            config = yaml.safe_load(file)
+            raw = file.read()
+        config = yaml.load(raw, Loader=_YAML_LOADER)
+
+        # Nothing to resolve if the file has no placeholders
+        if "${" not in raw:
+            return config
 
         # Replace environment variable placeholders with actual values
-        config = self.resolve_env_variables(config)
-        return config
+        return self.resolve_env_variables(config)
 
-    def resolve_env_variables(self, config: dict) -> dict:
+    def resolve_env_variables(self, config):
         """Resolve environment variable placeholders in the configuration."""
         if isinstance(config, dict):
-            for key, value in config.items():
-                config[key] = self.resolve_env_variables(value)
-        elif isinstance(config, list):
-            config = [self.resolve_env_variables(item) for item in config]
-        elif (
-            isinstance(config, str) and config.startswith("${") and config.endswith("}")
-        ):
-            env_var = config[2:-1]
-            env_value = os.getenv(env_var)
-            if not env_value:
-                raise EnvironmentError(f"Environment variable '{env_var}' is not set.")
-            return env_value
+            return {
+                key: self.resolve_env_variables(value) for key, value in config.items()
+            }
+        if isinstance(config, list):
+            return [self.resolve_env_variables(item) for item in config]
+        if isinstance(config, str) and "${" in config:
+            return _ENV_VAR_PATTERN.sub(self.resolve_env_variable, config)
         return config
 
+    @staticmethod
+    def resolve_env_variable(match: re.Match) -> str:
+        """Return the value of the environment variable named by a placeholder."""
+        env_var = match.group(1)
+        env_value = os.getenv(env_var)
+        if not env_value:
+            raise EnvironmentError(f"Environment variable '{env_var}' is not set.")
+        return env_value
+
+
+def setup_logging(log_file: str, log_level: str) -> QueueListener:
+    """Set up logging.
+
+    Log records are put on a queue and written to the log file and console by
+    a listener thread, so the event loop and extraction workers never block on
+    log I/O.
 
-def setup_logging(log_file: str, log_level: str):
-    """Set up logging."""
+    Args:
+        log_file (str): Path to the log file.
+        log_level (str): Logging level name.
+
+    Returns:
+        QueueListener: Started listener; call stop() to flush it on exit.
+    """
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
         numeric_level = logging.INFO
 
+    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = multiprocessing.Queue(-1)
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+
+    # Records are formatted once by the listener's handlers
     logging.basicConfig(
-        level=numeric_level,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
+        level=numeric_level, format="%(message)s", handlers=[QueueHandler(log_queue)]
     )
-    return logging.getLogger(__name__)
+    return listener
 
 
 # =========================
@@ -85,30 +146,46 @@ class PDFExtractor:
     """Class to extract text from PDF files."""
 
     @staticmethod
-    def extract_text(pdf_path: Path) -> str:
-        """Extract text from the specified PDF file.
+    def extract_text(
+        pdf_path: Path, start: int = 0, stop: Optional[int] = None
+    ) -> Tuple[str, int]:
+        """Extract text from a range of pages of the specified PDF file.
 
         Args:
             pdf_path (Path): Path to the PDF file.
+            start (int): Index of the first page to extract. Defaults to 0.
+            stop (Optional[int]): Index after the last page to extract.
+                Defaults to the end of the document.
 
         Returns:
-            str: Extracted text.
+            Tuple[str, int]: Extracted text and the total number of pages.
         """
-        logger.info(f"Extracting text from PDF file: {pdf_path}")
         try:
-            with open(pdf_path, "rb") as file:
-                reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page_num, page in enumerate(reader.pages, start=1):
-                    page_text = page.extract_text()
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            with pymupdf.open(pdf_path) as doc:
+                page_count = doc.page_count
+                stop = page_count if stop is None else min(stop, page_count)
+                if debug_enabled:
+                    logger.debug(
+                        "Extracting pages %d-%d of %s.", start + 1, stop, pdf_path
+                    )
+                parts = []
+                for page_index in range(start, stop):
+                    page_text = doc[page_index].get_text("text")
                     if page_text:
-                        text += page_text + "\n"
-                        logger.debug(f"Extracted text from page {page_num}.")
-            logger.info(f"Completed text extraction from PDF: {pdf_path}")
-            return text
+                        parts.append(page_text)
+                        if debug_enabled:
+                            logger.debug(
+                                "Extracted text from page %d.", page_index + 1
+                            )
+                return "\n".join(parts), page_count
         except Exception as e:
             logger.error(
-                f"Error occurred while extracting text from PDF '{pdf_path}': {e}"
+                "Error occurred while extracting pages %d-%s of PDF '%s': %s",
+                start + 1,
+                "end" if stop is None else stop,
+                pdf_path,
+                e,
             )
             raise
 
@@ -117,7 +194,12 @@ class PDFAnalyzer:
     """Class to manage PDF analysis and save results."""
 
     def __init__(
-        self, chat_xai: ChatXAI, prompt_template: PromptTemplate, max_length: int
+        self,
+        chat_xai: ChatXAI,
+        prompt_template: PromptTemplate,
+        max_length: int,
+        max_concurrency: int = 4,
+        max_input_tokens: Optional[int] = None,
     ):
         """Initialize the PDFAnalyzer.
 
@@ -125,9 +207,20 @@ class PDFAnalyzer:
             chat_xai (ChatXAI): Instance of ChatXAI.
             prompt_template (PromptTemplate): Prompt template.
             max_length (int): Maximum length of the summary.
+            max_concurrency (int): Maximum number of concurrent model requests.
+            max_input_tokens (Optional[int]): Maximum number of document tokens
+                sent to the model. No limit if None.
         """
+        self.prompt_template = prompt_template
+        self.prompt_text = prompt_template.template.strip()
         self.chain = RunnableSequence(prompt_template, chat_xai)
+        # Ask for usage in the final stream chunk; only the streaming call accepts it
+        self.stream_chain = RunnableSequence(
+            prompt_template, chat_xai.bind(stream_options={"include_usage": True})
+        )
         self.max_length = max_length
+        self.max_concurrency = max_concurrency
+        self.max_input_tokens = max_input_tokens
 
     def analyze_text(self, text: str) -> dict:
         """Analyze the extracted text and return the results along with token usage.
@@ -140,29 +233,152 @@ class PDFAnalyzer:
         """
         logger.info("Analyzing text using the Grok AI model.")
         try:
-            with get_openai_callback() as cb:
-                summary = self.chain.invoke({"document": text})
-                logger.info("Text analysis completed.")
-                logger.info(f"Prompt Tokens used: {cb.prompt_tokens}")
-                logger.info(f"Completion Tokens used: {cb.completion_tokens}")
-
-            summary_text = getattr(summary, "content", str(summary))
-
-            if len(summary_text) > self.max_length:
-                summary_text = summary_text[: self.max_length]
-                logger.warning(
-                    f"Summary exceeded the maximum length of {self.max_length} characters and was truncated."
-                )
+            text, input_tokens = self.prepare_input(text, self.max_input_tokens)
+            if self._fits_in_summary(text, input_tokens):
+                return self._passthrough_result(text)
 
-            return {
-                "summary": summary_text,
-                "input_tokens": cb.prompt_tokens,
-                "output_tokens": cb.completion_tokens,
-            }
+            summary = self.chain.invoke({"document": text})
+            logger.info("Text analysis completed.")
+
+            return self._build_result(summary, input_tokens)
+        except Exception as e:
+            logger.error("Error occurred during text analysis: %s", e)
+            raise
+
+    async def aanalyze_text(
+        self, text: str, input_tokens: Optional[int] = None
+    ) -> dict:
+        """Asynchronously analyze the extracted text.
+
+        The summary is streamed, and the request is stopped as soon as it
+        reaches the maximum length.
+
+        Args:
+            text (str): Text to analyze.
+            input_tokens (Optional[int]): Number of tokens in text if it was
+                already passed through prepare_input. Tokenizing is CPU-bound,
+                so it is otherwise done in a worker thread.
+
+        Returns:
+            dict: Analysis results and token usage.
+        """
+        logger.info("Analyzing text using the Grok AI model.")
+        try:
+            if input_tokens is None:
+                text, input_tokens = await asyncio.to_thread(
+                    self.prepare_input, text, self.max_input_tokens
+                )
+            if self._fits_in_summary(text, input_tokens):
+                return self._passthrough_result(text)
+
+            summary = None
+            summary_length = 0
+            stream = self.stream_chain.astream({"document": text})
+            try:
+                async for chunk in stream:
+                    summary = chunk if summary is None else summary + chunk
+                    summary_length += len(chunk.content)
+                    # Anything past max_length would be cut anyway, so stop paying for it
+                    if summary_length >= self.max_length:
+                        break
+            finally:
+                await stream.aclose()
+
+            if summary is None:
+                raise ValueError("The model returned an empty response.")
+            logger.info("Text analysis completed.")
+
+            # Counting the output tokens locally is CPU-bound as well
+            return await asyncio.to_thread(self._build_result, summary, input_tokens)
         except Exception as e:
-            logger.error(f"Error occurred during text analysis: {e}")
+            logger.error("Error occurred during text analysis: %s", e)
             raise
 
+    @staticmethod
+    def prepare_input(
+        text: str, max_input_tokens: Optional[int] = None
+    ) -> Tuple[str, int]:
+        """Cut the document to the input token budget before it is sent.
+
+        Args:
+            text (str): Document text.
+            max_input_tokens (Optional[int]): Maximum number of tokens to keep.
+                No limit if None.
+
+        Returns:
+            Tuple[str, int]: Document text and its number of tokens.
+
+        Raises:
+            ValueError: If the document has no text, e.g. a scanned PDF.
+        """
+        if not text.strip():
+            raise ValueError("No text extracted")
+
+        encoding = get_encoding()
+        tokens = encoding.encode(text, disallowed_special=())
+        if max_input_tokens is None or len(tokens) <= max_input_tokens:
+            return text, len(tokens)
+
+        logger.warning(
+            "Document has %d tokens and was truncated to %d tokens.",
+            len(tokens),
+            max_input_tokens,
+        )
+        return encoding.decode(tokens[:max_input_tokens]), max_input_tokens
+
+    def _fits_in_summary(self, text: str, input_tokens: int) -> bool:
+        """Whether the document is already no longer than the target summary.
+
+        The token count, at a rough four characters per token, rules out long
+        documents cheaply; the length check keeps the passthrough verbatim.
+        """
+        return (
+            input_tokens <= self.max_length // 4
+            and len(text.strip()) <= self.max_length
+        )
+
+    def _passthrough_result(self, text: str) -> dict:
+        """Use a short document as its own summary without calling the model."""
+        logger.info(
+            "Document is shorter than the maximum summary length; skipping the model."
+        )
+        return {
+            "summary": text.strip(),
+            "input_tokens": 0,
+            "output_tokens": 0,
+        }
+
+    def _build_result(self, summary, input_tokens: int) -> dict:
+        """Truncate the model output and attach token usage.
+
+        Falls back to local token estimates when the response carries no usage
+        metadata, e.g. because the stream was stopped early.
+        """
+        summary_text = getattr(summary, "content", str(summary))
+        usage = getattr(summary, "usage_metadata", None)
+        if usage:
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+        else:
+            output_tokens = len(
+                get_encoding().encode(summary_text, disallowed_special=())
+            )
+        logger.info("Prompt Tokens used: %d", input_tokens)
+        logger.info("Completion Tokens used: %d", output_tokens)
+
+        if len(summary_text) > self.max_length:
+            summary_text = summary_text[: self.max_length]
+            logger.warning(
+                "Summary exceeded the maximum length of %d characters and was truncated.",
+                self.max_length,
+            )
+
+        return {
+            "summary": summary_text,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+        }
+
     @staticmethod
     def save_to_json(data: dict, output_path: Path):
         """Save analysis results to a JSON file.
@@ -171,54 +387,157 @@ class PDFAnalyzer:
             data (dict): Data to save.
             output_path (Path): Path to save the JSON file.
         """
-        logger.info(f"Saving analysis results to JSON file: {output_path}")
+        logger.info("Saving analysis results to JSON file: %s", output_path)
         try:
-            with open(output_path, "w", encoding="utf-8") as json_file:
-                json.dump(data, json_file, ensure_ascii=False, indent=4)
-            logger.info(f"Successfully saved JSON file: {output_path}")
+            if orjson is not None:
+                with open(output_path, "wb") as json_file:
+                    json_file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as json_file:
+                    json.dump(data, json_file, ensure_ascii=False, indent=2)
+            logger.info("Successfully saved JSON file: %s", output_path)
         except Exception as e:
-            logger.error(f"Error occurred while saving JSON file '{output_path}': {e}")
+            logger.error(
+                "Error occurred while saving JSON file '%s': %s", output_path, e
+            )
             raise
 
+    @classmethod
+    async def asave_to_json(cls, data: dict, output_path: Path):
+        """Save analysis results to a JSON file without blocking the event loop.
+
+        Args:
+            data (dict): Data to save.
+            output_path (Path): Path to save the JSON file.
+        """
+        await asyncio.to_thread(cls.save_to_json, data, output_path)
+
+
+class ProcessedIndex:
+    """Class to record processed PDFs in a SQLite database."""
+
+    def __init__(self, db_path: Path):
+        """Open the index, creating it if needed.
+
+        Args:
+            db_path (Path): Path to the SQLite database file.
+        """
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS processed (
+                stem TEXT PRIMARY KEY,
+                mtime REAL,
+                input_tokens INTEGER,
+                output_tokens INTEGER,
+                summary_path TEXT
+            )
+            """
+        )
+        self.conn.commit()
+
+    def load(self) -> Dict[str, float]:
+        """Return the modification time recorded for each processed PDF.
+
+        Returns:
+            Dict[str, float]: PDF stem to modification time.
+        """
+        return dict(self.conn.execute("SELECT stem, mtime FROM processed"))
+
+    def mark_processed(
+        self,
+        stem: str,
+        mtime: float,
+        summary_path: Path,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+    ):
+        """Record a PDF as processed.
+
+        Args:
+            stem (str): Stem of the PDF file name.
+            mtime (float): Modification time of the PDF when it was processed.
+            summary_path (Path): Path to the saved summary JSON file.
+            input_tokens (Optional[int]): Prompt tokens used.
+            output_tokens (Optional[int]): Completion tokens used.
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO processed VALUES (?, ?, ?, ?, ?)",
+                (stem, mtime, input_tokens, output_tokens, str(summary_path)),
+            )
+
+    def token_totals(self) -> Tuple[int, int, int]:
+        """Return aggregate token usage over all processed PDFs.
+
+        Returns:
+            Tuple[int, int, int]: Number of PDFs, total prompt tokens and total
+                completion tokens.
+        """
+        return self.conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(SUM(input_tokens), 0),
+                   COALESCE(SUM(output_tokens), 0)
+            FROM processed
+            """
+        ).fetchone()
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
 
 # =========================
 # Main Processing Function
 # =========================
 
 
+@functools.lru_cache(maxsize=8)
+def _cached_load(config_path: str, mtime: Optional[float]) -> dict:
+    """Load a configuration file once per path and modification time."""
+    return Config(config_path).config
+
+
 def load_configuration(config_path: str = "config.yaml") -> dict:
     """Load configuration from a YAML file.
 
+    The parsed configuration is cached until the file is modified, so repeated
+    calls within a run do not re-parse the YAML.
+
     Args:
         config_path (str, optional): Path to the configuration file. Default is "config.yaml".
 
     Returns:
         dict: Configuration dictionary.
     """
-    config_loader = Config(config_path)
-    return config_loader.config
-
+    try:
+        mtime = os.path.getmtime(config_path)
+    except OSError:
+        # Let Config report the missing file
+        mtime = None
+    return _cached_load(config_path, mtime)
 
-def main():
-    """Main processing function."""
-    logger.info("Starting the application.")
 
-    config = load_configuration()
-    max_length = config.get("summary", {}).get("max_length", 500)
+def create_analyzer(config: dict) -> PDFAnalyzer:
+    """Create a PDFAnalyzer from the configuration.
 
-    input_dir = Path(config["directories"]["input"])
-    output_dir = Path(config["directories"]["output"])
-    input_dir.mkdir(parents=True, exist_ok=True)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Input directory: {input_dir.resolve()}")
-    logger.info(f"Output directory: {output_dir.resolve()}")
+    Args:
+        config (dict): Configuration dictionary.
 
-    # ======= Updated Section Starts Here =======
+    Returns:
+        PDFAnalyzer: Analyzer bound to the configured Grok model.
+    """
+    summary_config = config.get("summary", {})
+    max_length = summary_config.get("max_length", 500)
+    max_input_tokens = summary_config.get("max_input_tokens")
 
     # Retrieve the model from the configuration
     xai_config = config.get("xai", {})
     api_key = xai_config.get("api_key")
     model = xai_config.get("model", "grok-beta")  # Default to "grok-beta" if not specified
+    max_concurrency = xai_config.get("max_concurrency", 4)
 
     if not model:
         logger.error("No model specified in the configuration under 'xai.model'.")
@@ -230,54 +549,344 @@ def main():
         temperature=0.7,
     )
 
-    # ======= Updated Section Ends Here =======
-
     template = get_summary_prompt(max_length=max_length)
 
-    analyzer = PDFAnalyzer(
-        chat_xai=chat_xai, prompt_template=template, max_length=max_length
+    return PDFAnalyzer(
+        chat_xai=chat_xai,
+        prompt_template=template,
+        max_length=max_length,
+        max_concurrency=max_concurrency,
+        max_input_tokens=max_input_tokens,
     )
 
-    pdf_files = list(input_dir.glob("*.pdf"))
-    if not pdf_files:
-        logger.warning(f"No PDF files found in {input_dir}.")
-        return
 
-    for pdf_path in pdf_files:
-        try:
-            output_json_path = output_dir / f"{pdf_path.stem}_summary.json"
+def extract_first_pages(
+    pdf_path: Path, max_input_tokens: Optional[int]
+) -> Tuple[str, Optional[int], int]:
+    """Extract the first page range of a PDF file in a worker process.
 
-            if output_json_path.exists():
-                logger.info(
-                    f"Skipping {pdf_path.name} as {output_json_path.name} already exists."
+    When that range is the whole document, its text is also prepared for the
+    model here, so small PDFs need a single round trip to the pool.
+
+    Args:
+        pdf_path (Path): Path to the PDF file.
+        max_input_tokens (Optional[int]): Maximum number of document tokens
+            sent to the model. No limit if None.
+
+    Returns:
+        Tuple[str, Optional[int], int]: Extracted text, its number of tokens
+            (None if pages remain) and the total number of pages.
+    """
+    text, page_count = PDFExtractor.extract_text(pdf_path, 0, PAGES_PER_TASK)
+    if page_count > PAGES_PER_TASK:
+        return text, None, page_count
+    text, input_tokens = PDFAnalyzer.prepare_input(text, max_input_tokens)
+    return text, input_tokens, page_count
+
+
+async def extract_pdf(
+    pdf_path: Path, executor: ProcessPoolExecutor, max_input_tokens: Optional[int]
+) -> Tuple[str, int]:
+    """Extract text from a PDF file, spreading its pages across the pool.
+
+    PyMuPDF documents are not thread-safe, so large PDFs are split into page
+    ranges that each worker process opens and extracts on its own. Tokenizing
+    and truncating the text also happens in the pool, off the event loop.
+
+    Args:
+        pdf_path (Path): Path to the PDF file.
+        executor (ProcessPoolExecutor): Pool used for text extraction.
+        max_input_tokens (Optional[int]): Maximum number of document tokens
+            sent to the model. No limit if None.
+
+    Returns:
+        Tuple[str, int]: Extracted text and its number of tokens.
+    """
+    logger.info("Extracting text from PDF file: %s", pdf_path)
+    loop = asyncio.get_running_loop()
+    # The first range also reports the page count, so small PDFs need one call
+    text, input_tokens, page_count = await loop.run_in_executor(
+        executor, extract_first_pages, pdf_path, max_input_tokens
+    )
+    if input_tokens is None:
+        rest = await asyncio.gather(
+            *[
+                loop.run_in_executor(
+                    executor,
+                    PDFExtractor.extract_text,
+                    pdf_path,
+                    start,
+                    start + PAGES_PER_TASK,
                 )
-                continue
+                for start in range(PAGES_PER_TASK, page_count, PAGES_PER_TASK)
+            ]
+        )
+        parts = [text] + [part for part, _ in rest]
+        text, input_tokens = await loop.run_in_executor(
+            executor,
+            PDFAnalyzer.prepare_input,
+            "\n".join(part for part in parts if part),
+            max_input_tokens,
+        )
+    logger.info("Completed text extraction from PDF: %s", pdf_path)
+    return text, input_tokens
 
-            logger.info(f"Processing PDF: {pdf_path.name}")
-            extractor = PDFExtractor()
-            pdf_text = extractor.extract_text(pdf_path)
 
-            analysis_result = analyzer.analyze_text(pdf_text)
+def init_worker(log_queue: multiprocessing.Queue, log_level: int):
+    """Set up logging once in each extraction worker process.
 
-            result = {
-                "input_pdf": str(pdf_path.resolve()),
-                "prompt": template.template.strip(),
-                "summary": analysis_result["summary"],
-                "input_tokens": analysis_result["input_tokens"],
-                "output_tokens": analysis_result["output_tokens"],
-            }
+    Workers only enqueue records; the listener in the main process writes them.
+
+    Args:
+        log_queue (multiprocessing.Queue): Queue drained by the main process.
+        log_level (int): Logging level.
+    """
+    logging.basicConfig(
+        level=log_level, format="%(message)s", handlers=[QueueHandler(log_queue)]
+    )
+    # Load the tokenizer up front rather than inside the first extraction
+    get_encoding()
+
+
+async def extract_to_queue(
+    pending: List[Tuple[Path, float, Path]],
+    executor: ProcessPoolExecutor,
+    queue: asyncio.Queue,
+    num_workers: int,
+    max_input_tokens: Optional[int],
+):
+    """Extract text from PDF files and queue it for analysis.
+
+    num_workers producers take PDFs from pending one at a time, and each only
+    moves on once its text has been queued, so a slow model cannot cause
+    extracted text to pile up in memory.
+
+    Args:
+        pending (List[Tuple[Path, float, Path]]): PDF path, modification time
+            and output JSON path of each PDF to process.
+        executor (ProcessPoolExecutor): Pool used for text extraction.
+        queue (asyncio.Queue): Queue of extracted texts and their token counts.
+        num_workers (int): Maximum number of PDFs extracted at a time.
+        max_input_tokens (Optional[int]): Maximum number of document tokens
+            sent to the model. No limit if None.
+    """
+    # Shared by the producers, so the task count does not grow with pending
+    items = iter(pending)
+
+    async def produce():
+        for item in items:
+            pdf_path = item[0]
+            logger.info("Processing PDF: %s", pdf_path.name)
+            try:
+                text, input_tokens = await extract_pdf(
+                    pdf_path, executor, max_input_tokens
+                )
+            except Exception as e:
+                logger.error("Failed to process PDF '%s': %s", pdf_path.name, e)
+                continue
+            await queue.put((item, text, input_tokens))
+
+    await asyncio.gather(*[produce() for _ in range(num_workers)])
 
-            analyzer.save_to_json(result, output_json_path)
 
-            logger.info(f"Successfully processed and saved: {output_json_path.name}")
+async def analyze_from_queue(
+    analyzer: PDFAnalyzer, processed_index: ProcessedIndex, queue: asyncio.Queue
+):
+    """Summarize and save queued texts until a None sentinel is received.
 
+    Args:
+        analyzer (PDFAnalyzer): Analyzer used for summarization.
+        processed_index (ProcessedIndex): Index of processed PDFs.
+        queue (asyncio.Queue): Queue of extracted texts.
+    """
+    while True:
+        entry = await queue.get()
+        if entry is None:
+            return
+
+        (pdf_path, pdf_mtime, output_json_path), text, input_tokens = entry
+        try:
+            analysis_result = await analyzer.aanalyze_text(text, input_tokens)
         except Exception as e:
-            logger.error(f"Failed to process PDF '{pdf_path.name}': {e}")
+            logger.error("Failed to process PDF '%s': %s", pdf_path.name, e)
             continue
 
+        await save_result(
+            analyzer,
+            processed_index,
+            pdf_path,
+            pdf_mtime,
+            output_json_path,
+            analysis_result,
+        )
+
+
+async def save_result(
+    analyzer: PDFAnalyzer,
+    processed_index: ProcessedIndex,
+    pdf_path: Path,
+    pdf_mtime: float,
+    output_json_path: Path,
+    analysis_result: dict,
+):
+    """Assemble the result for a PDF, save it as JSON and record it as processed.
+
+    Args:
+        analyzer (PDFAnalyzer): Analyzer that produced the result.
+        processed_index (ProcessedIndex): Index of processed PDFs.
+        pdf_path (Path): Path to the PDF file.
+        pdf_mtime (float): Modification time of the PDF file.
+        output_json_path (Path): Path to save the JSON file.
+        analysis_result (dict): Analysis results and token usage.
+    """
+    try:
+        result = {
+            "input_pdf": str(pdf_path),
+            "prompt": analyzer.prompt_text,
+            "summary": analysis_result["summary"],
+            "input_tokens": analysis_result["input_tokens"],
+            "output_tokens": analysis_result["output_tokens"],
+        }
+
+        await analyzer.asave_to_json(result, output_json_path)
+        processed_index.mark_processed(
+            pdf_path.stem,
+            pdf_mtime,
+            output_json_path,
+            input_tokens=result["input_tokens"],
+            output_tokens=result["output_tokens"],
+        )
+
+        logger.info("Successfully processed and saved: %s", output_json_path.name)
+
+    except Exception as e:
+        logger.error("Failed to process PDF '%s': %s", pdf_path.name, e)
+
+
+async def amain(log_queue: multiprocessing.Queue):
+    """Main processing coroutine.
+
+    Args:
+        log_queue (multiprocessing.Queue): Queue that workers send log records to.
+    """
+    logger.info("Starting the application.")
+
+    config = load_configuration()
+
+    input_dir = Path(config["directories"]["input"])
+    output_dir = Path(config["directories"]["output"])
+    input_dir.mkdir(parents=True, exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Resolve once so the PDF paths listed below are already absolute
+    input_dir = input_dir.resolve()
+    output_dir = output_dir.resolve()
+    logger.info("Input directory: %s", input_dir)
+    logger.info("Output directory: %s", output_dir)
+
+    analyzer = create_analyzer(config)
+
+    with os.scandir(input_dir) as entries:
+        pdf_files = [
+            (Path(entry.path), entry.stat().st_mtime)
+            for entry in entries
+            if entry.name.endswith(".pdf") and entry.is_file()
+        ]
+    if not pdf_files:
+        logger.warning("No PDF files found in %s.", input_dir)
+        return
+
+    processed_index = ProcessedIndex(output_dir / INDEX_FILENAME)
+    try:
+        # One directory listing instead of a stat per PDF
+        with os.scandir(output_dir) as entries:
+            existing = {
+                entry.name[: -len(SUMMARY_SUFFIX)]
+                for entry in entries
+                if entry.name.endswith(SUMMARY_SUFFIX)
+            }
+
+        processed = processed_index.load()
+        # Adopt summaries the index does not know about, e.g. ones written
+        # before it existed
+        for pdf_path, pdf_mtime in pdf_files:
+            if pdf_path.stem in existing and pdf_path.stem not in processed:
+                processed_index.mark_processed(
+                    pdf_path.stem,
+                    pdf_mtime,
+                    output_dir / f"{pdf_path.stem}{SUMMARY_SUFFIX}",
+                )
+                processed[pdf_path.stem] = pdf_mtime
+
+        pending = []
+        for pdf_path, pdf_mtime in pdf_files:
+            # Redo the PDF if it changed or its summary was deleted
+            if (
+                processed.get(pdf_path.stem) == pdf_mtime
+                and pdf_path.stem in existing
+            ):
+                logger.info(
+                    "Skipping %s as it has already been processed.", pdf_path.name
+                )
+                continue
+            pending.append(
+                (pdf_path, pdf_mtime, output_dir / f"{pdf_path.stem}{SUMMARY_SUFFIX}")
+            )
+
+        if not pending:
+            logger.info("All PDF files in %s have already been processed.", input_dir)
+            return
+
+        # Extraction feeds the model requests as each PDF finishes, so the
+        # two stages overlap and only a bounded number of texts is in memory
+        num_workers = min(os.cpu_count() or 1, 4)
+        queue = asyncio.Queue(maxsize=analyzer.max_concurrency)
+        # The first call may download the tokenizer; keep that off the event
+        # loop, and load it before forking so workers inherit it
+        await asyncio.to_thread(get_encoding)
+        with ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=init_worker,
+            initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+        ) as executor:
+            consumers = [
+                asyncio.create_task(
+                    analyze_from_queue(analyzer, processed_index, queue)
+                )
+                for _ in range(analyzer.max_concurrency)
+            ]
+            try:
+                await extract_to_queue(
+                    pending, executor, queue, num_workers, analyzer.max_input_tokens
+                )
+                for _ in consumers:
+                    await queue.put(None)
+                await asyncio.gather(*consumers)
+            finally:
+                for consumer in consumers:
+                    consumer.cancel()
+
+        pdf_count, input_tokens, output_tokens = processed_index.token_totals()
+        logger.info(
+            "Processed PDFs: %d, total prompt tokens: %d, total completion tokens: %d",
+            pdf_count,
+            input_tokens,
+            output_tokens,
+        )
+    finally:
+        processed_index.close()
+
     logger.info("Application processing completed.")
 
 
+def main(log_queue: multiprocessing.Queue):
+    """Main processing function.
+
+    Args:
+        log_queue (multiprocessing.Queue): Queue that workers send log records to.
+    """
+    asyncio.run(amain(log_queue))
+
+
 if __name__ == "__main__":
     load_dotenv()
 
@@ -287,14 +896,15 @@ if __name__ == "__main__":
         print(f"Failed to load configuration: {e}")
         exit(1)
 
-    setup_logging(
+    log_listener = setup_logging(
         log_file=initial_config.get("logging", {}).get("log_file", "app.log"),
         log_level=initial_config.get("logging", {}).get("log_level", "INFO"),
     )
-    logger = logging.getLogger(__name__)
 
     try:
-        main()
+        main(log_listener.queue)
     except Exception as e:
-        logger.critical(f"A critical error occurred during application execution: {e}")
-        exit(1)
\ No newline at end of file
+        logger.critical("A critical error occurred during application execution: %s", e)
+        exit(1)
+    finally:
+        log_listener.stop()
\ No newline at end of file